@@ -1,23 +1,23 @@
 import asyncio
+import copy
 import logging
 import os
 import signal
+import stat
 import sys
 import tomllib
 import traceback
 from datetime import datetime, timedelta
+from typing import Optional, Tuple
 
 import aiofiles
 import tomli_w
 from rich.console import Console
-from rich.live import Live
 from rich.logging import RichHandler
 
 from src.Config import config
 from src.models import ServiceConfig, AppState
-from src.discovery import discover_nodes
-from src.telegraf import endpoints_from_config, update_telegraf_config
-from src.tui import TUILogHandler, generate_tui_layout
+from src.telegraf import endpoints_from_config, hash_nodes, update_telegraf_config
 
 # Setup logger
 logger = logging.getLogger("TelOAVDiscovery")
@@ -25,26 +25,92 @@ logger = logging.getLogger("TelOAVDiscovery")
 # Global flag for graceful shutdown
 shutdown_event = asyncio.Event()
 
+# Seconds without further model change events before rediscovering, so a
+# burst of events (e.g. a PLC download) triggers a single discovery
+MODEL_CHANGE_SETTLE_TIME = 2
+
 def handle_shutdown(signum, frame):
     """Handle shutdown signals gracefully"""
     logger.info(f"Received signal {signum}, initiating graceful shutdown...")
     shutdown_event.set()
 
+async def file_has_content(path: str, content: bytes) -> bool:
+    """Check whether a file already holds exactly ``content``, comparing sizes before reading"""
+    try:
+        if os.path.getsize(path) != len(content):
+            return False
+        async with aiofiles.open(path, "rb") as f:
+            return await f.read() == content
+    except OSError:
+        return False
+
+def file_stat_key(path: str) -> Optional[Tuple[int, int]]:
+    """(st_mtime_ns, st_size) of ``path``, or None if it doesn't exist"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+async def write_config_atomic(path: str, content: bytes) -> None:
+    """Replace ``path`` with ``content`` via a temp file and os.replace, so readers never see a partial file"""
+    tmp_path = f"{path}.tmp"
+    try:
+        existing = os.stat(path)
+    except FileNotFoundError:
+        existing = None
+    async with aiofiles.open(tmp_path, "wb") as f:
+        if existing is not None:
+            # os.replace puts the temp file's mode and owner on the output;
+            # carry over the existing ones (configs often hold tokens) before
+            # any content is written
+            os.fchmod(f.fileno(), stat.S_IMODE(existing.st_mode))
+            try:
+                os.fchown(f.fileno(), existing.st_uid, existing.st_gid)
+            except OSError as e:
+                logger.debug("Could not keep owner of %s: %s", path, e)
+        await f.write(content)
+        # Make the data durable before the rename, or a crash could leave an
+        # empty file under the final name
+        await f.flush()
+        await asyncio.to_thread(os.fsync, f.fileno())
+    try:
+        os.replace(tmp_path, path)
+    except OSError as e:
+        # e.g. the output is a single bind-mounted file, which can't be renamed over
+        logger.debug("Atomic replace of %s failed (%s), writing in place", path, e)
+        os.remove(tmp_path)
+        async with aiofiles.open(path, "wb") as f:
+            await f.write(content)
+
 async def fetch_and_update(service_config: ServiceConfig, state: AppState, use_tui: bool):
     """Core orchestration of discovery and configuration update"""
+    # Imported on first use: asyncua makes up most of the startup time, and
+    # the initial config copy shouldn't wait for it
+    from src.discovery import discover_nodes, prune_clients, sync_model_change_watchers
+
     config_changed = False
 
     logger.info("Reading Telegraf configuration from %s", service_config.TELEGRAF_CONFIG_PATH_IN)
 
     try:
-        async with aiofiles.open(service_config.TELEGRAF_CONFIG_PATH_IN, "rb") as f:
-            data = await f.read()
-        toml_config = tomllib.loads(data.decode("utf-8"))
-
-        if data != state.last_config_in:
-            state.last_config_in = data
-            config_changed = True
-            logger.info("Detected change in input configuration file")
+        # Only re-read the template when its mtime or size changed, and only
+        # parse it when its bytes changed since the last poll
+        in_stat = os.stat(service_config.TELEGRAF_CONFIG_PATH_IN)
+        stat_key = (in_stat.st_mtime_ns, in_stat.st_size)
+        if stat_key != state.last_config_in_stat:
+            async with aiofiles.open(service_config.TELEGRAF_CONFIG_PATH_IN, "rb") as f:
+                data = await f.read()
+
+            if data != state.last_config_in:
+                state.last_config_parsed = tomllib.loads(data.decode("utf-8"))
+                state.last_config_in = data
+                config_changed = True
+                logger.info("Detected change in input configuration file")
+            state.last_config_in_stat = stat_key
+
+        # update_telegraf_config fills in nodes in place, keep the cached template pristine
+        toml_config = copy.deepcopy(state.last_config_parsed)
     except FileNotFoundError:
         logger.error("Configuration file not found: %s", service_config.TELEGRAF_CONFIG_PATH_IN)
         return
@@ -52,32 +118,30 @@ async def fetch_and_update(service_config: ServiceConfig, state: AppState, use_t
         logger.error("Failed to read configuration: %s", e)
         return
 
-    try:
-        async with aiofiles.open(service_config.TELEGRAF_CONFIG_PATH_OUT, "rb") as f:
-            output_data = await f.read()
-            output_toml = tomllib.loads(output_data.decode("utf-8"))
-    except FileNotFoundError:
-        output_toml = None
-        config_changed = True
-    except Exception as e:
-        logger.error("Failed to read output configuration: %s", e)
-        return
-
     endpoints_to_monitor = endpoints_from_config(toml_config)
     logger.info("Found %d endpoint(s) to monitor", len(endpoints_to_monitor))
+    await prune_clients(endpoints_to_monitor)
+
+    if service_config.WATCH_MODEL_CHANGES and service_config.POLLING_INTERVAL > 0:
+        sync_model_change_watchers(endpoints_to_monitor, state.model_changed)
+
+    # Parallelize discovery, bounded so a large config doesn't open every
+    # session at once
+    semaphore = asyncio.Semaphore(max(1, service_config.MAX_PARALLEL_DISCOVERIES))
+
+    async def bounded_discover(endpoint: str):
+        async with semaphore:
+            return await discover_nodes(
+                endpoint,
+                state=state,
+                naming_strategy=service_config.NAMING_STRATEGY,
+                enable_id_tag=service_config.ENABLE_ID_TAG,
+                include_ns0=service_config.INCLUDE_NS0,
+                use_tui=use_tui,
+                use_cache=service_config.CACHE_DISCOVERY
+            )
 
-    # Parallelize discovery
-    discovery_tasks = [
-        discover_nodes(
-            endpoint, 
-            state=state,
-            naming_strategy=service_config.NAMING_STRATEGY, 
-            enable_id_tag=service_config.ENABLE_ID_TAG,
-            include_ns0=service_config.INCLUDE_NS0, 
-            use_tui=use_tui
-        )
-        for endpoint in endpoints_to_monitor
-    ]
+    discovery_tasks = [bounded_discover(endpoint) for endpoint in endpoints_to_monitor]
     
     results = await asyncio.gather(*discovery_tasks, return_exceptions=True)
     
@@ -94,9 +158,37 @@ async def fetch_and_update(service_config: ServiceConfig, state: AppState, use_t
             discovered_nodes_by_endpoint[endpoint] = nodes
             resolved_endpoints_map[endpoint] = resolved
 
+    # Nothing to do if neither the template, any discovery result nor the
+    # output on disk changed since the last successful write; skips
+    # re-parsing and diffing the output
+    nodes_hashes = {
+        endpoint: (resolved_endpoints_map[endpoint], hash_nodes(nodes))
+        for endpoint, nodes in discovered_nodes_by_endpoint.items()
+    }
+    if (not config_changed and nodes_hashes == state.last_nodes_hashes
+            and state.last_output_stat is not None
+            and file_stat_key(service_config.TELEGRAF_CONFIG_PATH_OUT) == state.last_output_stat):
+        logger.info("No configuration changes detected, skipping file write")
+        if service_config.POLLING_INTERVAL > 0:
+            state.next_update_time = datetime.now() + timedelta(seconds=service_config.POLLING_INTERVAL)
+        return
+
+    try:
+        async with aiofiles.open(service_config.TELEGRAF_CONFIG_PATH_OUT, "rb") as f:
+            output_data = await f.read()
+            output_toml = tomllib.loads(output_data.decode("utf-8"))
+    except FileNotFoundError:
+        output_data = None
+        output_toml = None
+        config_changed = True
+    except Exception as e:
+        logger.error("Failed to read output configuration: %s", e)
+        return
+
     # Update logic moved to src.telegraf
     logic_changed, nodes_updated_count = update_telegraf_config(
-        toml_config, output_toml, discovered_nodes_by_endpoint, resolved_endpoints_map
+        toml_config, output_toml, discovered_nodes_by_endpoint, resolved_endpoints_map,
+        {endpoint: digest for endpoint, (_, digest) in nodes_hashes.items()}
     )
     
     if logic_changed:
@@ -104,20 +196,58 @@ async def fetch_and_update(service_config: ServiceConfig, state: AppState, use_t
 
     if config_changed:
         try:
-            output_content = tomli_w.dumps(toml_config)
-            async with aiofiles.open(service_config.TELEGRAF_CONFIG_PATH_OUT, "wb") as f:
-                await f.write(output_content.encode("utf-8"))
-            logger.info("Updated Telegraf config written to %s (%d endpoint(s) updated)",
-                        service_config.TELEGRAF_CONFIG_PATH_OUT, nodes_updated_count)
+            output_content = tomli_w.dumps(toml_config).encode("utf-8")
+            # Compared against what is on disk right now, so a deleted or
+            # replaced output is always rewritten
+            if output_content == output_data:
+                logger.info("Generated configuration identical to existing output, skipping file write")
+            else:
+                await write_config_atomic(service_config.TELEGRAF_CONFIG_PATH_OUT, output_content)
+                logger.info("Updated Telegraf config written to %s (%d endpoint(s) updated)",
+                            service_config.TELEGRAF_CONFIG_PATH_OUT, nodes_updated_count)
+            state.last_nodes_hashes = nodes_hashes
+            state.last_output_stat = file_stat_key(service_config.TELEGRAF_CONFIG_PATH_OUT)
         except Exception as e:
             logger.error("Error writing config file: %s", e)
     else:
         logger.info("No configuration changes detected, skipping file write")
+        state.last_nodes_hashes = nodes_hashes
+        state.last_output_stat = file_stat_key(service_config.TELEGRAF_CONFIG_PATH_OUT)
 
     # Set next update time if polling
     if service_config.POLLING_INTERVAL > 0:
         state.next_update_time = datetime.now() + timedelta(seconds=service_config.POLLING_INTERVAL)
 
+async def wait_until(timeout: float, *events: asyncio.Event) -> None:
+    """Wait until one of ``events`` is set or ``timeout`` seconds elapsed"""
+    waiters = [asyncio.ensure_future(event.wait()) for event in events]
+    try:
+        await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for waiter in waiters:
+            waiter.cancel()
+
+async def wait_for_next_poll(timeout: float, model_changed: asyncio.Event):
+    """Wait until the polling interval elapsed, a shutdown was requested or a model change was reported
+
+    A model change is debounced: the wait continues until no further event
+    arrived for MODEL_CHANGE_SETTLE_TIME seconds, but at most ``timeout``
+    seconds after the first one, so a server that keeps sending events
+    still gets rediscovered.
+    """
+    await wait_until(timeout, shutdown_event, model_changed)
+    if not model_changed.is_set():
+        return
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while model_changed.is_set() and not shutdown_event.is_set():
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        model_changed.clear()
+        await wait_until(min(MODEL_CHANGE_SETTLE_TIME, remaining), shutdown_event, model_changed)
+
 async def main_async():
     signal.signal(signal.SIGTERM, handle_shutdown)
     signal.signal(signal.SIGINT, handle_shutdown)
@@ -132,9 +262,17 @@ async def main_async():
     logger.setLevel(logging.DEBUG)
 
     if use_tui:
+        from src.tui import TUILogHandler
         tui_handler = TUILogHandler(state)
         tui_handler.setLevel(logging.INFO)
         logger.addHandler(tui_handler)
+    elif os.getenv("LOG_FORMAT", "").lower() == "plain":
+        # Plain lines for log collectors (e.g. docker logs); cheaper per
+        # record than RichHandler's rendering
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(logging.INFO)
+        console_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(message)s'))
+        logger.addHandler(console_handler)
     else:
         console_handler = RichHandler(rich_tracebacks=True)
         console_handler.setLevel(logging.INFO)
@@ -160,41 +298,53 @@ async def main_async():
     try:
         async with aiofiles.open(service_config.TELEGRAF_CONFIG_PATH_IN, "rb") as f_in:
             content = await f_in.read()
-        async with aiofiles.open(service_config.TELEGRAF_CONFIG_PATH_OUT, "wb") as f_out:
-            await f_out.write(content)
+        # Leave an identical output untouched so watchers (telegraf
+        # --watch-config) don't reload for nothing
+        if not await file_has_content(service_config.TELEGRAF_CONFIG_PATH_OUT, content):
+            await write_config_atomic(service_config.TELEGRAF_CONFIG_PATH_OUT, content)
     except Exception as e:
         logger.error("Failed to copy initial config file: %s", e)
 
     console = Console() if use_tui else None
+    if use_tui:
+        from rich.live import Live
+        from src.tui import generate_tui_layout, invalidate_terminal_size, refresh_live
+        if hasattr(signal, "SIGWINCH"):
+            signal.signal(signal.SIGWINCH, invalidate_terminal_size)
 
     if use_tui and service_config.POLLING_INTERVAL > 0:
-        with Live(generate_tui_layout(state), console=console, refresh_per_second=4, screen=True) as live:
-            while not shutdown_event.is_set():
-                await fetch_and_update(service_config, state, use_tui)
-
-                for _ in range(service_config.POLLING_INTERVAL * 4):
-                    if shutdown_event.is_set():
-                        break
-                    live.update(generate_tui_layout(state))
-                    try:
-                        await asyncio.wait_for(shutdown_event.wait(), timeout=0.25)
-                    except asyncio.TimeoutError:
-                        pass
+        # Frames are rendered by refresh_live on the event loop, never from
+        # Live's refresh thread, which would race with discovery updates
+        with Live(generate_tui_layout(state, console), console=console, auto_refresh=False, screen=True) as live:
+            refresher = asyncio.create_task(refresh_live(live))
+            try:
+                while not shutdown_event.is_set():
+                    state.model_changed.clear()
+                    await fetch_and_update(service_config, state, use_tui)
+
+                    # Update once per discovery; the status bar countdown and
+                    # the logs are rendered lazily on each frame
+                    live.update(generate_tui_layout(state, console))
+                    await wait_for_next_poll(service_config.POLLING_INTERVAL, state.model_changed)
+            finally:
+                refresher.cancel()
     elif use_tui:
         await fetch_and_update(service_config, state, use_tui)
-        console.print(generate_tui_layout(state))
+        console.print(generate_tui_layout(state, console))
         console.print("\nDiscovery complete.")
     elif service_config.POLLING_INTERVAL > 0:
         while not shutdown_event.is_set():
+            state.model_changed.clear()
             await fetch_and_update(service_config, state, use_tui)
             logger.info("Waiting for %d seconds before next poll...", service_config.POLLING_INTERVAL)
-            try:
-                await asyncio.wait_for(shutdown_event.wait(), timeout=service_config.POLLING_INTERVAL)
-            except asyncio.TimeoutError:
-                pass
+            await wait_for_next_poll(service_config.POLLING_INTERVAL, state.model_changed)
     else:
         await fetch_and_update(service_config, state, use_tui)
 
+    from src.discovery import close_clients, stop_model_change_watchers
+    await stop_model_change_watchers()
+    await close_clients()
+
 if __name__ == '__main__':
     print("Starting TelOAVDiscovery...", flush=True)
     try:
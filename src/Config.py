@@ -1,48 +1,108 @@
 from dataclasses import MISSING, is_dataclass
+import functools
 import json
 import tomllib
 import os
+import sys
 
 import argparse
-from typing import Type, get_origin, get_args, Union
+from typing import Any, Callable, Type, get_origin, get_args, get_type_hints, Union
 
 import tomli_w
 
+# Optional faster JSON backend; orjson.JSONDecodeError subclasses json.JSONDecodeError
+try:
+    import orjson
 
-def _convert_env_var(value: str, target_type: Type):
-    """Helper to convert environment variable string to a target type."""
+    def _json_loads(data: bytes):
+        return orjson.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_loads(data: bytes):
+        return json.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=4).encode("utf-8")
+
+
+def _parse_bool(value: str) -> bool:
+    return value.lower() in ('true', '1', 'yes', 'on')
+
+
+@functools.cache
+def _make_converter(target_type: Type) -> Callable[[str], Any]:
+    """Helper to build a converter from environment variable string to a target type.
+
+    Cached per type, so a type shared by several fields, dataclasses or Union
+    members is only resolved once.
+    """
     origin = get_origin(target_type)
     args = get_args(target_type)
 
     if origin is Union:
         # For Union, try to convert to each type in order
-        for arg in args:
-            try:
-                return _convert_env_var(value, arg)
-            except (ValueError, TypeError, json.JSONDecodeError):
-                continue
-        raise ValueError(f"Could not convert '{value}' to any of {args}")
+        converters = [_make_converter(arg) for arg in args]
+
+        def convert_union(value: str):
+            for converter in converters:
+                try:
+                    return converter(value)
+                except (ValueError, TypeError, json.JSONDecodeError):
+                    continue
+            raise ValueError(f"Could not convert '{value}' to any of {args}")
+
+        return convert_union
 
     if origin in (list, dict) or target_type in (list, dict):
-        try:
-            return json.loads(value)
-        except json.JSONDecodeError:
-            raise ValueError(f"Invalid JSON for {target_type}: {value}")
+        def convert_json(value: str):
+            try:
+                return _json_loads(value)
+            except json.JSONDecodeError:
+                raise ValueError(f"Invalid JSON for {target_type}: {value}")
+
+        return convert_json
 
     if target_type is bool:
-        return value.lower() in ('true', '1', 'yes', 'on')
-    if target_type is int:
-        return int(value)
-    if target_type is float:
-        return float(value)
-    if target_type is str:
-        return value
+        return _parse_bool
+    if target_type in (int, float, str):
+        return target_type
 
     # Fallback for other types or if no specific conversion is found
+    def convert_fallback(value: str):
+        try:
+            return target_type(value)
+        except (TypeError, ValueError):
+            return value
+
+    return convert_fallback
+
+
+@functools.lru_cache(maxsize=None)
+def _field_table(target: Type) -> tuple[tuple[str, str, Any, Any, Callable[[str], Any]], ...]:
+    """(name, env var, default, default_factory, converter) per dataclass field, built once per dataclass."""
+    # Resolved hints rather than Field.type, which is a plain string when the
+    # dataclass is declared under `from __future__ import annotations`
     try:
-        return target_type(value)
-    except (TypeError, ValueError):
-        return value
+        hints = get_type_hints(target)
+    except NameError:
+        # Some annotation names a type not visible from the dataclass' module
+        # (e.g. a class local to a function); resolve the fields one by one,
+        # so only the unresolvable ones keep their string type and lose
+        # coercion
+        module_globals = vars(sys.modules[target.__module__])
+        hints = {}
+        for name, f in target.__dataclass_fields__.items():
+            try:
+                hints[name] = eval(f.type, module_globals) if isinstance(f.type, str) else f.type
+            except NameError:
+                pass
+    # noinspection PyUnresolvedReferences
+    return tuple(
+        (name, name.upper(), f.default, f.default_factory, _make_converter(hints.get(name, f.type)))
+        for name, f in target.__dataclass_fields__.items()
+    )
 
 
 def config[X](target: Type[X], config_path: str | None = None) -> X:
@@ -77,30 +137,27 @@ def config[X](target: Type[X], config_path: str | None = None) -> X:
                     for k, v in tomllib.load(f).items():
                         config[k] = v
             case "json":
-                with open(config_path, "r", encoding="utf-8") as f:
-                    for k, v in json.load(f).items():
+                with open(config_path, "rb") as f:
+                    for k, v in _json_loads(f.read()).items():
                         config[k] = v
             case other:
                 raise ValueError(f"unsupported configuration file format: {other}")
 
-    # noinspection PyUnresolvedReferences
-    dc_fields = target.__dataclass_fields__
-
-    for k in dc_fields.keys():
+    env = os.environ
+    for k, env_name, default, default_factory, converter in _field_table(target):
         # Set default value from dataclass, if not already set by TOML Config
         if k not in config:
-            if dc_fields[k].default is not MISSING:
-                config[k] = dc_fields[k].default
-            elif dc_fields[k].default_factory is not MISSING:
-                config[k] = dc_fields[k].default_factory()
+            if default is not MISSING:
+                config[k] = default
+            elif default_factory is not MISSING:
+                config[k] = default_factory()
 
         # Override with value from environment variable, if exists
-        env_value = os.getenv(k.upper())
+        env_value = env.get(env_name)
 
         if env_value is not None:
             # Try to convert env var to the field's type
-            field_type = dc_fields[k].type
-            config[k] = _convert_env_var(env_value, field_type)
+            config[k] = converter(env_value)
 
         # If key is still missing, raise error
         if k not in config:
@@ -127,7 +184,7 @@ def dump_config(config_instance: object, path: str) -> None:
             with open(path, "wb") as f:
                 tomli_w.dump(config_dict, f)
         case "json":
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(config_dict, f, indent=4)
+            with open(path, "wb") as f:
+                f.write(_json_dumps(config_dict))
         case other:
             raise ValueError(f"unsupported configuration file format: {other}")
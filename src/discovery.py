@@ -1,99 +1,317 @@
 import asyncio
+import itertools
 import logging
 import socket
 from datetime import datetime
 from urllib.parse import urlparse, urlunparse
-from typing import Union, List, Tuple, Set, Optional
+from typing import List, Tuple, Set, Optional, Dict
 
 from asyncua import Client, ua
-from asyncua.ua import Int32, String, Guid, ByteString
 
-from src.models import AppState
+from src.models import AppState, DiscoveredNode, EndpointStat
 
 logger = logging.getLogger("TelOAVDiscovery")
 
-def get_identifier_type(identifier: Union[Int32, String, Guid, ByteString, ua.Guid, int, float]) -> str:
-    if any(isinstance(identifier, t) for t in [Guid, ua.Guid]):
-        return 'g'
-    if any(isinstance(identifier, t) for t in [Int32, int, float]):
-        return 'i'
-    if isinstance(identifier, str):
-        return 's'
-    return 'b'
-
-async def browse_recursive(node, nodes_to_add: List[dict], seen_node_ids: Set[str], naming_strategy: str = "plain", enable_id_tag: bool = False, include_ns0: bool = False, current_path: List[str] = None):
-    if current_path is None:
-        current_path = []
-        
+# Upper bound on nodes per Browse request. Lowered per session to the
+# server's MaxNodesPerBrowse, beyond which it rejects the whole request with
+# BadTooManyOperations
+MAX_NODES_PER_REQUEST = 500
+
+# Upper bound on Browse requests in flight per session, so a very wide tree
+# level doesn't flood a server with hundreds of concurrent requests
+MAX_CONCURRENT_REQUESTS = 32
+
+# Publishing interval (ms) of model change event subscriptions, and the delay
+# (s) before a lost subscription session is re-established
+MODEL_CHANGE_PUBLISH_INTERVAL = 1000
+MODEL_CHANGE_RETRY_DELAY = 30
+
+# Connected client per endpoint, with the resolved URL it was opened on.
+# Sessions are kept across polls and only re-established after a failure.
+_client_pool: Dict[str, Tuple[str, Client]] = {}
+
+# Nodes per Browse request for the pooled client of each endpoint
+_browse_batch_sizes: Dict[str, int] = {}
+
+# Serializes use of an endpoint's pooled client, so a discovery never runs
+# on a session that is being replaced or closed
+_client_locks: Dict[str, asyncio.Lock] = {}
+
+# (fingerprint, nodes) of the last discovery per endpoint, used when
+# discovery caching is enabled. The fingerprint covers the server's start
+# time and build info, the discovery options and the number of model change
+# events received for the endpoint.
+_discovery_cache: Dict[str, Tuple[tuple, List[DiscoveredNode]]] = {}
+
+# Model change events received per endpoint
+_model_change_counts: Dict[str, int] = {}
+
+# Source of endpoint_stats versions
+_stats_versions = itertools.count(1)
+
+# Running model change watcher per endpoint
+_model_change_watchers: Dict[str, asyncio.Task] = {}
+
+# Telegraf identifier_type per NodeId encoding
+_NODEID_TYPE_TO_CHAR: Dict[ua.NodeIdType, str] = {
+    ua.NodeIdType.TwoByte: 'i',
+    ua.NodeIdType.FourByte: 'i',
+    ua.NodeIdType.Numeric: 'i',
+    ua.NodeIdType.String: 's',
+    ua.NodeIdType.Guid: 'g',
+    ua.NodeIdType.ByteString: 'b',
+}
+
+def make_node_entry(node_id: ua.NodeId, browse_name: str, path: List[str], naming_strategy: str = "plain", enable_id_tag: bool = False) -> DiscoveredNode:
+    """Build the Telegraf node entry for a discovered variable"""
+    # Apply Naming Strategy
+    if naming_strategy == "suffix":
+        name = f"value_{browse_name}"
+    elif naming_strategy == "prefix":
+        name = f"{browse_name}_value"
+    elif naming_strategy == "path":
+        name = "_".join(path + [browse_name])
+    elif naming_strategy in ("browsename", "name"):
+        # Field name == browse name (e.g. "P_CC"). Produces one
+        # column per tag, matching a hand-written explicit group.
+        name = browse_name
+    else:
+        name = "value"
+
+    ## Node ID configuration
+    return DiscoveredNode(
+        name=name,
+        namespace=str(node_id.NamespaceIndex),
+        identifier_type=_NODEID_TYPE_TO_CHAR.get(node_id.NodeIdType, 'b'),
+        identifier=f"{node_id.Identifier}",
+        # Apply Tagging Strategy (Independent)
+        default_tags={"id": browse_name} if enable_id_tag else None
+    )
+
+async def browse_many(session, node_ids: List[ua.NodeId]) -> List[List[ua.ReferenceDescription]]:
+    """Browse the hierarchical children of several nodes in a single Browse request.
+
+    Only Object and Variable children are requested; the server filters out
+    methods, types and views, which never hold telemetry. Continuation points
+    are followed with BrowseNext. Returns one list of references per node, in
+    the order of ``node_ids``.
+    """
+    params = ua.BrowseParameters()
+    params.View.Timestamp = ua.get_win_epoch()
+    params.RequestedMaxReferencesPerNode = 0
+    for node_id in node_ids:
+        description = ua.BrowseDescription()
+        description.NodeId = node_id
+        description.BrowseDirection = ua.BrowseDirection.Forward
+        description.ReferenceTypeId = ua.NodeId(ua.ObjectIds.HierarchicalReferences)
+        description.IncludeSubtypes = True
+        description.NodeClassMask = ua.NodeClass.Object | ua.NodeClass.Variable
+        description.ResultMask = ua.BrowseResultMask.All
+        params.NodesToBrowse.append(description)
+
+    results = await session.browse(params)
+
+    references_per_node = []
+    for result in results:
+        references = list(result.References) if result.StatusCode.is_good() else []
+        continuation_point = result.ContinuationPoint
+        while continuation_point:
+            next_params = ua.BrowseNextParameters()
+            next_params.ContinuationPoints = [continuation_point]
+            next_params.ReleaseContinuationPoints = False
+            next_results = await session.browse_next(next_params)
+            if not next_results or not next_results[0].StatusCode.is_good():
+                break
+            references.extend(next_results[0].References)
+            continuation_point = next_results[0].ContinuationPoint
+        references_per_node.append(references)
+    return references_per_node
+
+def chunked(items: list, size: int = MAX_NODES_PER_REQUEST):
+    """Split a list into request-sized chunks"""
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+async def browse_bfs(root, nodes_to_add: List[DiscoveredNode], seen_node_ids: Set[ua.NodeId], naming_strategy: str = "plain", enable_id_tag: bool = False, include_ns0: bool = False, batch_size: int = MAX_NODES_PER_REQUEST):
+    """Breadth-first browse below ``root``, appending discovered variables to ``nodes_to_add``.
+
+    Each tree level costs one batched Browse (per ``batch_size`` nodes). NodeClass and BrowseName come with the returned references, so no
+    attribute reads are needed. Raises the error of the first failed batch.
+    """
+    session = root.session
+    seen_node_ids.add(root.nodeid)
+    request_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    # (node id, browse path of the node)
+    frontier: List[Tuple[ua.NodeId, List[str]]] = [(root.nodeid, [])]
+
+    async def bounded_browse(node_ids: List[ua.NodeId]):
+        async with request_slots:
+            return await browse_many(session, node_ids)
+
+    while frontier:
+        children: List[Tuple[ua.NodeId, List[str]]] = []
+        # Large levels span several requests; send them concurrently
+        batches = list(chunked(frontier, batch_size))
+        browse_results = await asyncio.gather(
+            *(bounded_browse([node_id for node_id, _ in batch]) for batch in batches),
+            return_exceptions=True
+        )
+        for batch, references_per_node in zip(batches, browse_results):
+            # A missing batch drops whole subtrees, so fail the discovery
+            # rather than report a truncated node list; discover_nodes then
+            # drops the (possibly stalled) client
+            if isinstance(references_per_node, Exception):
+                raise references_per_node
+
+            for (_, path), references in zip(batch, references_per_node):
+                for reference in references:
+                    node_id = reference.NodeId
+
+                    # Deduplication; NodeIds hash on (namespace, identifier),
+                    # no string form needed
+                    if node_id in seen_node_ids:
+                        continue
+                    seen_node_ids.add(node_id)
+
+                    # Drop standard (Namespace 0) nodes unless ns0 is
+                    # explicitly requested. This also prunes their subtrees,
+                    # e.g. the Server object (i=2253), under which some
+                    # servers expose session/subscription diagnostics
+                    # *instances* in a non-zero namespace.
+                    if not include_ns0 and node_id.NamespaceIndex == 0:
+                        continue
+
+                    browse_name_str = reference.BrowseName.Name
+                    if reference.NodeClass == ua.NodeClass.Variable:
+                        nodes_to_add.append(make_node_entry(node_id, browse_name_str, path, naming_strategy, enable_id_tag))
+                        logger.debug("Discovered node: %s (ns=%d)", browse_name_str, node_id.NamespaceIndex)
+
+                    # Always descend to find nested variables/objects
+                    children.append((node_id, path + [browse_name_str]))
+
+        frontier = children
+
+async def get_client(endpoint: str, resolved_endpoint: str) -> Client:
+    """Return the pooled client of ``endpoint``, connecting a new one if there is none or it is no longer usable"""
+    pooled = _client_pool.get(endpoint)
+    if pooled is not None:
+        pooled_url, client = pooled
+        if pooled_url == resolved_endpoint:
+            try:
+                # Re-raises errors of the keepalive watchdog, e.g. after a server restart
+                await client.check_connection()
+                return client
+            except Exception as e:
+                logger.info("Session to %s lost (%s), reconnecting", endpoint, e)
+        await drop_client(endpoint)
+
+    logger.debug("Connecting to %s...", resolved_endpoint)
+    client = Client(url=resolved_endpoint)
+    await client.connect()
+    logger.debug("Connected to %s", resolved_endpoint)
+    _client_pool[endpoint] = (resolved_endpoint, client)
+    _browse_batch_sizes[endpoint] = await browse_batch_size(client)
+    return client
+
+async def browse_batch_size(client: Client) -> int:
+    """Nodes per Browse request on ``client``: the server's MaxNodesPerBrowse (0 meaning no limit), capped at MAX_NODES_PER_REQUEST"""
     try:
-        children = await node.get_children()
-    except Exception as e:
-        logger.debug(f"Failed to get children for node: {e}")
+        limit = await client.get_node(ua.ObjectIds.Server_ServerCapabilities_OperationLimits_MaxNodesPerBrowse).read_value()
+    except ua.UaStatusCodeError as e:
+        logger.debug("Failed to read MaxNodesPerBrowse, assuming %d: %s", MAX_NODES_PER_REQUEST, e)
+        return MAX_NODES_PER_REQUEST
+    if not limit:
+        return MAX_NODES_PER_REQUEST
+    return min(limit, MAX_NODES_PER_REQUEST)
+
+async def drop_client(endpoint: str):
+    """Remove the pooled client of ``endpoint`` and close its session, ignoring errors of dead connections"""
+    pooled = _client_pool.pop(endpoint, None)
+    _browse_batch_sizes.pop(endpoint, None)
+    if pooled is None:
         return
+    try:
+        await pooled[1].disconnect()
+    except Exception as e:
+        logger.debug("Error closing session to %s: %s", endpoint, e)
 
-    for child in children:
-        try:
-            node_id = child.nodeid
-            node_id_str = node_id.to_string()
-
-            # Deduplication
-            if node_id_str in seen_node_ids:
-                continue
-            seen_node_ids.add(node_id_str)
-
-            # Skip the standard Server node subtree (i=2253) unless ns0 is
-            # explicitly requested. Some servers expose session/subscription
-            # diagnostics *instances* under Server in a non-zero namespace, so
-            # the NamespaceIndex == 0 filter alone doesn't keep them out.
-            if not include_ns0 and node_id.NamespaceIndex == 0 and node_id.Identifier == ua.ObjectIds.Server:
-                continue
-
-            browse_name = await child.read_browse_name()
-            browse_name_str = browse_name.Name
-            
-            node_class = await child.read_node_class()
-            if node_class == ua.NodeClass.Variable:
-                # Configurable Namespace 0 exclusion
-                if not include_ns0 and node_id.NamespaceIndex == 0:
-                    continue
-
-                ## Node ID configuration
-                node_entry = {
-                    "name": "value",
-                    "namespace": str(node_id.NamespaceIndex),
-                    "identifier_type": get_identifier_type(node_id.Identifier),
-                    "identifier": f"{node_id.Identifier}"
-                }
-
-                # Apply Naming Strategy
-                if naming_strategy == "suffix":
-                    node_entry["name"] = f"value_{browse_name_str}"
-                elif naming_strategy == "prefix":
-                    node_entry["name"] = f"{browse_name_str}_value"
-                elif naming_strategy == "path":
-                    full_path = current_path + [browse_name_str]
-                    node_entry["name"] = "_".join(full_path)
-                elif naming_strategy in ("browsename", "name"):
-                    # Field name == browse name (e.g. "P_CC"). Produces one
-                    # column per tag, matching a hand-written explicit group.
-                    node_entry["name"] = browse_name_str
-                else:
-                    node_entry["name"] = "value"
-
-                # Apply Tagging Strategy (Independent)
-                if enable_id_tag:
-                    node_entry["default_tags"] = {"id": browse_name_str}
-
-                nodes_to_add.append(node_entry)
-                logger.debug(f"Discovered node: {browse_name_str} (ns={node_id.NamespaceIndex})")
-
-            # Always recurse to find nested variables/objects
-            await browse_recursive(child, nodes_to_add, seen_node_ids, naming_strategy, enable_id_tag, include_ns0, current_path + [browse_name_str])
-        except Exception as e:
-            logger.debug(f"Error processing child node: {e}")
-            continue
+async def prune_clients(endpoints: List[str]):
+    """Close the pooled sessions of endpoints no longer configured and forget their cached results"""
+    async def close(endpoint: str):
+        async with _client_locks.setdefault(endpoint, asyncio.Lock()):
+            await drop_client(endpoint)
+            _discovery_cache.pop(endpoint, None)
+
+    removed = [endpoint for endpoint in list(_client_pool) if endpoint not in endpoints]
+    await asyncio.gather(*(close(endpoint) for endpoint in removed))
+
+async def close_clients():
+    """Close all pooled sessions, waiting for running discoveries on them to finish"""
+    async def close(endpoint: str):
+        async with _client_locks.setdefault(endpoint, asyncio.Lock()):
+            await drop_client(endpoint)
+
+    await asyncio.gather(*(close(endpoint) for endpoint in list(_client_pool)))
+
+async def server_fingerprint(client: Client) -> Optional[tuple]:
+    """StartTime and BuildInfo of the server, read in one request; None if the server doesn't expose them"""
+    try:
+        start_time, build_info = await client.read_values([
+            client.get_node(ua.ObjectIds.Server_ServerStatus_StartTime),
+            client.get_node(ua.ObjectIds.Server_ServerStatus_BuildInfo),
+        ])
+    except ua.UaStatusCodeError as e:
+        logger.debug("Failed to read server status for fingerprinting: %s", e)
+        return None
+    return start_time, build_info
 
-async def discover_nodes(endpoint: str, state: Optional[AppState] = None, naming_strategy: str = "plain", enable_id_tag: bool = False, include_ns0: bool = False, use_tui: bool = False) -> Tuple[str, List[dict]]:
+def record_endpoint_stats(state: AppState, endpoint: str, status: str, nodes: List[DiscoveredNode]):
+    """Publish a discovery result of ``endpoint`` to the TUI state"""
+    now = datetime.now()
+    stats = state.endpoint_stats.get(endpoint)
+    if stats is None:
+        stats = state.endpoint_stats[endpoint] = EndpointStat(status)
+    stats.status = status
+    stats.node_count = len(nodes)
+    stats.nodes = nodes
+    stats.last_update = now
+    # Bumped on every result, so renderers can tell results apart without
+    # comparing them; set last, after the fields it stands for
+    stats.version = next(_stats_versions)
+    state.last_update_time = now
+
+async def discover_on_client(client: Client, endpoint: str, naming_strategy: str, enable_id_tag: bool, include_ns0: bool, use_cache: bool) -> List[DiscoveredNode]:
+    """Discover the variables of ``endpoint`` on ``client``, reusing the cached result if the server is unchanged"""
+    nodes_to_add = []
+    seen_node_ids: Set[ua.NodeId] = set()
+
+    fingerprint = None
+    if use_cache:
+        server_status = await server_fingerprint(client)
+        if server_status is not None:
+            # Taken before browsing, so an event arriving mid-browse
+            # invalidates the entry stored below
+            fingerprint = (server_status, naming_strategy, enable_id_tag, include_ns0,
+                           _model_change_counts.get(endpoint, 0))
+
+    cached = _discovery_cache.get(endpoint)
+    if fingerprint is not None and cached is not None and cached[0] == fingerprint:
+        logger.info(f"Server {endpoint} unchanged since last discovery, reusing {len(cached[1])} nodes")
+        return cached[1]
+
+    objects_node = client.get_objects_node()
+    await browse_bfs(objects_node, nodes_to_add, seen_node_ids, naming_strategy, enable_id_tag, include_ns0,
+                     _browse_batch_sizes.get(endpoint, MAX_NODES_PER_REQUEST))
+    # Only reached when every batch succeeded (browse_bfs raises
+    # otherwise). An empty result is not cached either: it more likely
+    # means the server is still starting than that it has no variables
+    if fingerprint is not None and nodes_to_add:
+        _discovery_cache[endpoint] = (fingerprint, nodes_to_add)
+
+    logger.info(f"Discovered {len(nodes_to_add)} nodes on {endpoint}")
+    return nodes_to_add
+
+async def discover_nodes(endpoint: str, state: Optional[AppState] = None, naming_strategy: str = "plain", enable_id_tag: bool = False, include_ns0: bool = False, use_tui: bool = False, use_cache: bool = False) -> Tuple[str, List[DiscoveredNode]]:
     logger.info(f"Starting discovery on endpoint: {endpoint}")
 
     resolved_endpoint = endpoint
@@ -115,50 +333,107 @@ async def discover_nodes(endpoint: str, state: Optional[AppState] = None, naming
             if endpoint != resolved_endpoint:
                 logger.info(f"Resolved endpoint {endpoint} to {resolved_endpoint}")
     except Exception as e:
-        logger.debug(f"Failed to resolve hostname for {endpoint}: {e}")
+        logger.debug("Failed to resolve hostname for %s: %s", endpoint, e)
 
     nodes_to_add = []
-    seen_node_ids = set()
 
-    try:
-        logger.debug(f"Connecting to {resolved_endpoint}...")
-        async with Client(url=resolved_endpoint) as client:
-            logger.debug(f"Connected to {resolved_endpoint}")
-            objects_node = client.get_objects_node()
-            await browse_recursive(objects_node, nodes_to_add, seen_node_ids, naming_strategy, enable_id_tag, include_ns0)
-
-        logger.info(f"Discovered {len(nodes_to_add)} nodes on {endpoint}")
-
-        if use_tui and state is not None:
-            state.endpoint_stats[endpoint] = {
-                "status": "Connected",
-                "node_count": len(nodes_to_add),
-                "nodes": nodes_to_add,
-                "last_update": datetime.now()
-            }
-            state.last_update_time = datetime.now()
-
-    except ConnectionError as e:
-        logger.error(f"Connection failed to {endpoint}: {e}")
-        if use_tui and state is not None:
-            state.endpoint_stats[endpoint] = {
-                "status": "Connection Failed",
-                "node_count": 0,
-                "nodes": [],
-                "last_update": datetime.now()
-            }
-            state.last_update_time = datetime.now()
-        return resolved_endpoint, []
-    except Exception as e:
-        logger.error(f"Unexpected error discovering nodes on {endpoint}: {e}", exc_info=True)
-        if use_tui and state is not None:
-            state.endpoint_stats[endpoint] = {
-                "status": f"Error: {str(e)[:30]}",
-                "node_count": 0,
-                "nodes": [],
-                "last_update": datetime.now()
-            }
-            state.last_update_time = datetime.now()
-        return resolved_endpoint, []
+    async with _client_locks.setdefault(endpoint, asyncio.Lock()):
+        try:
+            pooled = _client_pool.get(endpoint)
+            client = await get_client(endpoint, resolved_endpoint)
+            try:
+                nodes_to_add = await discover_on_client(client, endpoint, naming_strategy, enable_id_tag, include_ns0, use_cache)
+            except Exception as e:
+                if pooled is None or pooled[1] is not client:
+                    raise
+                # A pooled session can pass check_connection and still fail
+                # its first request, e.g. after a server restart; give a new
+                # session a try before reporting the endpoint as failed
+                logger.info("Discovery on reused session to %s failed (%s), retrying on a new session", endpoint, e)
+                await drop_client(endpoint)
+                client = await get_client(endpoint, resolved_endpoint)
+                nodes_to_add = await discover_on_client(client, endpoint, naming_strategy, enable_id_tag, include_ns0, use_cache)
+
+            if use_tui and state is not None:
+                record_endpoint_stats(state, endpoint, "Connected", nodes_to_add)
+
+        except ConnectionError as e:
+            logger.error(f"Connection failed to {endpoint}: {e}")
+            await drop_client(endpoint)
+            if use_tui and state is not None:
+                record_endpoint_stats(state, endpoint, "Connection Failed", [])
+            return resolved_endpoint, []
+        except Exception as e:
+            logger.error(f"Unexpected error discovering nodes on {endpoint}: {e}", exc_info=True)
+            await drop_client(endpoint)
+            if use_tui and state is not None:
+                record_endpoint_stats(state, endpoint, f"Error: {str(e)[:30]}", [])
+            return resolved_endpoint, []
 
     return resolved_endpoint, nodes_to_add
+
+class ModelChangeHandler:
+    """Subscription handler that flags model change events of an endpoint"""
+    def __init__(self, endpoint: str, changed: asyncio.Event):
+        self.endpoint = endpoint
+        self.changed = changed
+
+    def event_notification(self, event):
+        logger.info("Address space of %s changed, triggering rediscovery", self.endpoint)
+        _model_change_counts[self.endpoint] = _model_change_counts.get(self.endpoint, 0) + 1
+        self.changed.set()
+
+async def watch_model_changes(endpoint: str, changed: asyncio.Event):
+    """Keep a session on ``endpoint`` subscribed to model change events, setting ``changed`` on each.
+
+    Runs on a session of its own, separate from the pooled discovery client:
+    that one is dropped and reopened after any failed discovery, which would
+    take the subscription down with it. Each watched server therefore holds
+    two sessions. The session is opened on the configured URL, so a changed
+    DNS entry is picked up when it is re-established.
+
+    Returns when the server doesn't support the subscription, in which case
+    periodic polling remains the only trigger. Lost sessions are re-established
+    after MODEL_CHANGE_RETRY_DELAY seconds.
+    """
+    while True:
+        try:
+            async with Client(url=endpoint) as client:
+                subscription = await client.create_subscription(
+                    MODEL_CHANGE_PUBLISH_INTERVAL, ModelChangeHandler(endpoint, changed)
+                )
+                try:
+                    # BaseModelChangeEventType also matches GeneralModelChangeEvents
+                    await subscription.subscribe_events(client.nodes.server, ua.ObjectIds.BaseModelChangeEventType)
+                except ua.UaStatusCodeError as e:
+                    logger.info("Endpoint %s doesn't support model change events (%s), relying on polling", endpoint, e)
+                    return
+                logger.info("Watching %s for model change events", endpoint)
+
+                while True:
+                    await asyncio.sleep(MODEL_CHANGE_RETRY_DELAY)
+                    await client.check_connection()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("Model change subscription on %s lost (%s), retrying in %ds",
+                           endpoint, e, MODEL_CHANGE_RETRY_DELAY)
+            await asyncio.sleep(MODEL_CHANGE_RETRY_DELAY)
+
+def sync_model_change_watchers(endpoints: List[str], changed: asyncio.Event):
+    """Start watchers for new endpoints and cancel those of endpoints no longer configured"""
+    for endpoint in list(_model_change_watchers):
+        if endpoint not in endpoints:
+            _model_change_watchers.pop(endpoint).cancel()
+
+    for endpoint in endpoints:
+        if endpoint not in _model_change_watchers:
+            _model_change_watchers[endpoint] = asyncio.create_task(watch_model_changes(endpoint, changed))
+
+async def stop_model_change_watchers():
+    """Cancel all watchers and wait for their sessions to close"""
+    tasks = list(_model_change_watchers.values())
+    _model_change_watchers.clear()
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
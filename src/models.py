@@ -1,7 +1,8 @@
+import asyncio
 from dataclasses import dataclass, field
 from datetime import datetime
 from collections import deque
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple
 
 @dataclass
 class ServiceConfig:
@@ -15,15 +16,58 @@ class ServiceConfig:
     NAMING_STRATEGY: str = "path"  # Options: "plain", "prefix", "suffix", "path"
     ENABLE_ID_TAG: bool = False      # Whether to add the 'id' tag to nodes
     INCLUDE_NS0: bool = False        # Whether to include nodes from Namespace 0
+    WATCH_MODEL_CHANGES: bool = False  # Rediscover shortly after a server reports a model change (polling mode only)
+    MAX_PARALLEL_DISCOVERIES: int = 8  # Upper bound on endpoints discovered concurrently
+    CACHE_DISCOVERY: bool = False  # Reuse the last discovery while the server's start time and build info are unchanged
+
+@dataclass(slots=True)
+class DiscoveredNode:
+    """
+    A variable found during discovery, in Telegraf node terms
+    Kept as a slotted object while browsing; turned into a TOML table by to_dict
+    """
+    name: str
+    namespace: str
+    identifier_type: str
+    identifier: str
+    default_tags: Optional[Dict[str, str]] = None
+
+    def to_dict(self) -> dict:
+        node = {
+            "name": self.name,
+            "namespace": self.namespace,
+            "identifier_type": self.identifier_type,
+            "identifier": self.identifier,
+        }
+        if self.default_tags is not None:
+            node["default_tags"] = self.default_tags
+        return node
+
+@dataclass(slots=True)
+class EndpointStat:
+    """
+    Latest discovery result of an endpoint, as shown by the TUI
+    Updated in place on every discovery; version is bumped last
+    """
+    status: str
+    node_count: int = 0
+    nodes: List[DiscoveredNode] = field(default_factory=list)
+    last_update: Optional[datetime] = None
+    version: int = 0
 
 @dataclass
 class AppState:
     """
     Global application state for TUI and orchestration
     """
-    endpoint_stats: Dict = field(default_factory=dict)
+    endpoint_stats: Dict[str, EndpointStat] = field(default_factory=dict)
     last_update_time: Optional[datetime] = None
     next_update_time: Optional[datetime] = None
     last_config_in: Optional[bytes] = None
+    last_config_in_stat: Optional[Tuple[int, int]] = None  # (st_mtime_ns, st_size) of the last read
+    last_config_parsed: Optional[dict] = None
+    last_nodes_hashes: Dict[str, Tuple[str, bytes]] = field(default_factory=dict)  # endpoint -> (resolved endpoint, node digest)
+    last_output_stat: Optional[Tuple[int, int]] = None  # (st_mtime_ns, st_size) of the output as last written or verified
     polling_interval: int = 0
+    model_changed: asyncio.Event = field(default_factory=asyncio.Event)  # set by model change watchers
     log_messages: deque = field(default_factory=lambda: deque(maxlen=100))
@@ -1,7 +1,10 @@
+import hashlib
 import logging
 import tomllib
 import tomli_w
-from typing import List, Literal, Set
+from typing import Dict, List, Literal, Optional, Set, Union
+
+from src.models import DiscoveredNode
 
 logger = logging.getLogger("TelOAVDiscovery")
 
@@ -26,10 +29,38 @@ def node_container(block: dict) -> dict:
         return groups[0]
     return block
 
+def node_key(node: Union[DiscoveredNode, dict]) -> tuple:
+    """Canonical tuple of a node, identical for a DiscoveredNode and its TOML table"""
+    if isinstance(node, DiscoveredNode):
+        return (
+            node.name,
+            node.namespace,
+            node.identifier_type,
+            node.identifier,
+            tuple(sorted((node.default_tags or {}).items())),
+        )
+    return (
+        node.get("name"),
+        node.get("namespace"),
+        node.get("identifier_type"),
+        str(node.get("identifier")),
+        tuple(sorted(node.get("default_tags", {}).items())),
+    )
+
+def hash_nodes(nodes: List[Union[DiscoveredNode, dict]]) -> bytes:
+    """Digest of a node list, used to detect changes between polls without a deep compare"""
+    canonical = tuple(node_key(node) for node in nodes)
+    return hashlib.blake2b(repr(canonical).encode("utf-8"), digest_size=16).digest()
+
+def nodes_to_toml(nodes: List[Union[DiscoveredNode, dict]]) -> List[dict]:
+    """Materialize discovered nodes as TOML tables"""
+    return [node.to_dict() if isinstance(node, DiscoveredNode) else node for node in nodes]
+
 def endpoints_from_config(toml_config: dict) -> List[str]:
     """Extract OPC UA endpoints from Telegraf configuration"""
     inputs = toml_config.get("inputs", {})
-    endpoints_to_monitor = []
+    # Insertion-ordered set: O(1) deduplication, first occurrence wins
+    endpoints_to_monitor: dict[str, None] = {}
 
     for input_type in INPUT_TYPES:
         if input_type not in inputs:
@@ -40,21 +71,25 @@ def endpoints_from_config(toml_config: dict) -> List[str]:
             endpoint = type_fields.get("endpoint", None)
             if endpoint is None:
                 raise ValueError(f"Missing 'endpoint' for input type '{input_type}'")
-            if endpoint not in endpoints_to_monitor:
-                endpoints_to_monitor.append(endpoint)
+            endpoints_to_monitor.setdefault(endpoint, None)
 
-    return endpoints_to_monitor
+    return list(endpoints_to_monitor)
 
 def update_telegraf_config(
     toml_config: dict, 
     output_toml: dict, 
     discovered_nodes_by_endpoint: dict, 
-    resolved_endpoints_map: dict
+    resolved_endpoints_map: dict,
+    discovered_hashes: Optional[Dict[str, bytes]] = None
 ) -> tuple[bool, int]:
     """
     Updates the in-memory toml_config with discovered nodes.
+    Node lists are compared by hash_nodes digest; ``discovered_hashes`` may
+    pass digests of the discovered lists that are already known.
     Returns (config_changed, nodes_updated_count)
     """
+    # Digest of every discovered list, computed at most once per endpoint
+    discovered_hashes = dict(discovered_hashes or {})
     config_changed = False
     nodes_updated_count = 0
     inputs = toml_config.get("inputs", {})
@@ -66,14 +101,21 @@ def update_telegraf_config(
         input_blocks = inputs.get(input_type, [])
         output_blocks = output_toml.get("inputs", {}).get(input_type, []) if output_toml else []
 
-        for idx, config_block in enumerate(input_blocks):
+        # Existing OUT blocks by endpoint, so blocks are matched even when the
+        # OUT file lists them in a different order or count than the template
+        output_by_endpoint: Dict[str, dict] = {}
+        for output_block in output_blocks:
+            output_by_endpoint.setdefault(output_block.get("endpoint", ""), output_block)
+
+        for config_block in input_blocks:
             endpoint = config_block.get("endpoint")
             if endpoint and endpoint in discovered_nodes_by_endpoint:
                 nodes = discovered_nodes_by_endpoint[endpoint]
                 resolved_endpoint = resolved_endpoints_map.get(endpoint)
 
-                # Safely get existing config from OUT file to compare
-                existing_block = output_blocks[idx] if idx < len(output_blocks) else {}
+                # The OUT file holds the resolved endpoint once it was written
+                existing_block = (output_by_endpoint.get(resolved_endpoint or endpoint)
+                                  or output_by_endpoint.get(endpoint, {}))
                 existing_nodes = node_container(existing_block).get("nodes", []) if existing_block else []
                 existing_endpoint = existing_block.get("endpoint", "")
 
@@ -90,8 +132,12 @@ def update_telegraf_config(
                         logger.debug(f"Endpoint changed in output: {existing_endpoint} -> {resolved_endpoint}")
 
                 if nodes:
-                    if existing_nodes != nodes:
-                        target["nodes"] = nodes
+                    # Always inject: toml_config is the fresh template, so an
+                    # unchanged node list still has to be written back out
+                    target["nodes"] = nodes_to_toml(nodes)
+                    if endpoint not in discovered_hashes:
+                        discovered_hashes[endpoint] = hash_nodes(nodes)
+                    if hash_nodes(existing_nodes) != discovered_hashes[endpoint]:
                         nodes_updated_count += 1
                         config_changed = True
                         logger.debug("Updated configuration for endpoint: %s", endpoint)
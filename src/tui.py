@@ -1,12 +1,16 @@
+import asyncio
 import logging
 from datetime import datetime
-from rich.console import Console
+from itertools import islice
+from typing import Dict, List, Optional, Tuple
+
+from rich.console import Console, ConsoleOptions, RenderResult
 from rich.layout import Layout
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
-from src.models import AppState
+from src.models import AppState, EndpointStat
 
 class TUILogHandler(logging.Handler):
     """Custom log handler that stores messages for AppState display"""
@@ -15,24 +19,62 @@ class TUILogHandler(logging.Handler):
         self.state = state
 
     def emit(self, record):
+        created = datetime.fromtimestamp(record.created)
         log_entry = {
-            "time": datetime.fromtimestamp(record.created),
+            "time": created,
+            # Formatted once here instead of on every log panel build
+            "time_str": created.strftime("%H:%M:%S"),
             "level": record.levelname,
             "message": record.getMessage()
         }
         self.state.log_messages.append(log_entry)
 
-def generate_tui_layout(state: AppState) -> Layout:
-    """Generate the Rich TUI layout based on AppState"""
-    layout = Layout()
+# Terminal height of the last layout build; reset by invalidate_terminal_size
+# (installed as SIGWINCH handler) so the terminal is only queried after a resize
+_terminal_height: Optional[int] = None
 
-    # Create header
-    header = Panel(
-        Text("TelOAV Discovery - OPC UA Node Monitor", justify="center", style="bold white"),
-        style="bold white"
-    )
+# Endpoint panels of the previous layout, keyed by endpoint and tagged with
+# the stats' version and the row limit; reused until a new discovery result
+# arrives or the terminal is resized
+_panel_cache: Dict[str, Tuple[Tuple[int, int], Panel]] = {}
+
+# Layout tree of the previous build, keyed by (endpoints, logs shown)
+_layout_cache: Tuple[Optional[Tuple[Tuple[str, ...], bool]], Optional[Layout]] = (None, None)
+
+# Status bar of the previous render, keyed by its text; the countdown only
+# changes once per second while the TUI ticks four times per second
+_status_panel_cache: Tuple[Optional[str], Optional[Panel]] = (None, None)
+
+# Log panel of the previous render, keyed by (id of newest entry, entry count)
+_log_panel_cache: Tuple[Optional[Tuple[int, int]], Optional[Panel]] = (None, None)
+
+HEADER_PANEL = Panel(
+    Text("TelOAV Discovery - OPC UA Node Monitor", justify="center", style="bold white"),
+    style="bold white"
+)
 
-    # Create status info
+# Number of most recent log messages shown in the log panel
+LOG_PANEL_ROWS = 8
+
+# Seconds between frames of the live TUI
+TUI_REFRESH_INTERVAL = 0.25
+
+LEVEL_STYLES: Dict[str, str] = {
+    "ERROR": "bold red",
+    "WARNING": "bold yellow",
+    "INFO": "bold green",
+    "DEBUG": "dim cyan",
+}
+
+# Styled level labels, shared by all log panel rows
+LEVEL_TEXTS: Dict[str, Text] = {level: Text(level, style=style) for level, style in LEVEL_STYLES.items()}
+
+def create_status_panel(state: AppState) -> Panel:
+    """Create the status bar panel (last update, counts, countdown)
+
+    The panel is reused while its text is unchanged.
+    """
+    global _status_panel_cache
     if state.last_update_time is not None:
         last_update_str = state.last_update_time.strftime('%Y-%m-%d %H:%M:%S')
     else:
@@ -56,13 +98,129 @@ def generate_tui_layout(state: AppState) -> Layout:
     elif state.polling_interval > 0:
         status_text += f" | Polling every {state.polling_interval}s"
 
-    status_panel = Panel(Text(status_text, justify="center"), style="green")
+    if _status_panel_cache[0] == status_text:
+        return _status_panel_cache[1]
+
+    panel = Panel(Text(status_text, justify="center"), style="green")
+    _status_panel_cache = (status_text, panel)
+    return panel
+
+async def refresh_live(live) -> None:
+    """Render frames of ``live`` until cancelled.
+
+    Replaces Live's auto refresh: that runs in a thread of its own, where the
+    renderables below would read the endpoint stats, logs and panel caches
+    while the event loop mutates them. Rendering from a task keeps every read
+    on the loop.
+    """
+    while True:
+        await asyncio.sleep(TUI_REFRESH_INTERVAL)
+        live.refresh()
+
+class StatusBar:
+    """Status bar renderable; the countdown is computed whenever Live renders a frame"""
+    def __init__(self, state: AppState):
+        self.state = state
+
+    def __rich__(self) -> Panel:
+        return create_status_panel(self.state)
+
+class LogView:
+    """Log panel renderable, picking up new messages whenever Live renders a frame"""
+    def __init__(self, state: AppState):
+        self.state = state
+
+    def __rich__(self) -> Panel:
+        return create_log_panel(self.state)
+
+class EndpointView:
+    """Endpoint panel renderable, sized to the region Layout renders it into"""
+    def __init__(self, endpoint: str, state: AppState):
+        self.endpoint = endpoint
+        self.state = state
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        stats = self.state.endpoint_stats.get(self.endpoint)
+        if stats is None:
+            return
+        height = options.height or options.size.height
+        yield get_endpoint_panel(self.endpoint, stats, rows_for_height(height))
+
+def get_endpoint_panel(endpoint: str, stats: EndpointStat, display_limit: int = 50) -> Panel:
+    """Return the endpoint panel, rebuilding it only if the stats or row limit changed since the last call"""
+    cache_key = (stats.version, display_limit)
+    cached = _panel_cache.get(endpoint)
+    if cached is not None and cached[0] == cache_key:
+        return cached[1]
+
+    panel = create_endpoint_table(endpoint, stats, display_limit)
+    _panel_cache[endpoint] = (cache_key, panel)
+    return panel
+
+def grid_columns(count: int) -> int:
+    """Number of endpoint panels per row"""
+    if count == 1:
+        return 1
+    elif count in (2, 4):
+        return 2
+    return 3
+
+def rows_for_height(height: int) -> int:
+    """Node rows that fit into an endpoint panel of ``height`` lines; more would be cut off anyway"""
+    # Panel border and padding, table title, header and borders take about 9
+    # lines; with show_lines every node row takes 2, one is kept for the
+    # "... more nodes" row
+    return max(5, (height - 9) // 2 - 1)
+
+def invalidate_terminal_size(signum=None, frame=None) -> None:
+    """Forget the cached terminal height; usable as a SIGWINCH handler"""
+    global _terminal_height
+    _terminal_height = None
+
+def terminal_height(console: Console) -> int:
+    """Height of ``console``, cached until invalidate_terminal_size is called"""
+    global _terminal_height
+    if _terminal_height is None:
+        _terminal_height = console.size.height
+    return _terminal_height
+
+def generate_tui_layout(state: AppState, console: Console) -> Layout:
+    """Generate the Rich TUI layout based on AppState
+
+    The layout tree is reused while the endpoints and the log region stay the
+    same; only its panels are swapped.
+    """
+    global _layout_cache
 
     # Determine if we have enough space for logs (console height check)
-    console = Console()
-    console_height = console.size.height
+    console_height = terminal_height(console)
     show_logs = console_height > 30
 
+    endpoints = list(state.endpoint_stats.keys())
+    layout_key = (tuple(endpoints), show_logs)
+    if _layout_cache[0] == layout_key:
+        layout = _layout_cache[1]
+    else:
+        layout = build_layout_skeleton(endpoints, show_logs)
+        _layout_cache = (layout_key, layout)
+
+    layout["status"].update(StatusBar(state))
+
+    if endpoints:
+        for endpoint in endpoints:
+            layout[endpoint].update(EndpointView(endpoint, state))
+    else:
+        layout["main"].update(Panel("No endpoints configured", style="yellow"))
+
+    if show_logs:
+        layout["logs"].update(LogView(state))
+
+    return layout
+
+def build_layout_skeleton(endpoints: List[str], show_logs: bool) -> Layout:
+    """Build the layout tree: header, status bar, one region per endpoint and optionally logs"""
+    layout = Layout()
+
     if show_logs:
         layout.split_column(
             Layout(name="header", size=3),
@@ -77,22 +235,11 @@ def generate_tui_layout(state: AppState) -> Layout:
             Layout(name="main")
         )
 
-    layout["header"].update(header)
-    layout["status"].update(status_panel)
+    layout["header"].update(HEADER_PANEL)
 
-    if state.endpoint_stats:
-        endpoints = list(state.endpoint_stats.keys())
+    if endpoints:
         count = len(endpoints)
-
-        if count == 1:
-            cols = 1
-        elif count == 2:
-            cols = 2
-        elif count == 4:
-            cols = 2
-        else:
-            cols = 3
-
+        cols = grid_columns(count)
         rows = (count + cols - 1) // cols
 
         row_layouts = []
@@ -116,19 +263,9 @@ def generate_tui_layout(state: AppState) -> Layout:
 
             layout[f"row_{i}"].split_row(*col_layouts)
 
-            for endpoint in row_endpoints:
-                table = create_endpoint_table(endpoint, state.endpoint_stats[endpoint])
-                layout[endpoint].update(table)
-    else:
-        layout["main"].update(Panel("No endpoints configured", style="yellow"))
-
-    if show_logs:
-        log_panel = create_log_panel(state)
-        layout["logs"].update(log_panel)
-
     return layout
 
-def create_endpoint_table(endpoint: str, stats: dict) -> Panel:
+def create_endpoint_table(endpoint: str, stats: EndpointStat, display_limit: int = 50) -> Panel:
     """Create a table showing nodes for a specific endpoint"""
     table = Table(
         title=f"{endpoint}",
@@ -143,17 +280,16 @@ def create_endpoint_table(endpoint: str, stats: dict) -> Panel:
     table.add_column("Identifier", style="white", no_wrap=False)
     table.add_column("Identifier Type", style="green", no_wrap=False)
 
-    status_color = "green" if stats["status"] == "Connected" else "red"
-    nodes = stats.get("nodes", [])
+    status_color = "green" if stats.status == "Connected" else "red"
+    nodes = stats.nodes
 
-    if stats["status"] == "Connected" and nodes:
-        display_limit = 50
+    if stats.status == "Connected" and nodes:
         for i, node in enumerate(nodes[:display_limit]):
             table.add_row(
-                node.get("name", "N/A"),
-                node.get("namespace", "N/A"),
-                str(node.get("identifier", "N/A")),
-                node.get("identifier_type", "Unknown")
+                node.name,
+                node.namespace,
+                node.identifier,
+                node.identifier_type
             )
 
         if len(nodes) > display_limit:
@@ -162,19 +298,27 @@ def create_endpoint_table(endpoint: str, stats: dict) -> Panel:
                 "", "", "",
                 style="dim italic"
             )
-    elif stats["status"] != "Connected":
-        table.add_row(f"{stats['status']}", "", "", "", style="bold red")
+    elif stats.status != "Connected":
+        table.add_row(f"{stats.status}", "", "", "", style="bold red")
     else:
         table.add_row("No nodes discovered", "", "", "", style="dim italic")
 
-    subtitle = f"Status: [{status_color}]{stats['status']}[/{status_color}] | Nodes: {stats['node_count']}"
-    if stats.get('last_update'):
-        subtitle += f" | Updated: {stats['last_update'].strftime('%H:%M:%S')}"
+    subtitle = f"Status: [{status_color}]{stats.status}[/{status_color}] | Nodes: {stats.node_count}"
+    if stats.last_update:
+        subtitle += f" | Updated: {stats.last_update.strftime('%H:%M:%S')}"
 
     return Panel(table, subtitle=subtitle, border_style=status_color, padding=(1, 2))
 
 def create_log_panel(state: AppState) -> Panel:
-    """Create a panel showing recent log messages from AppState"""
+    """Create a panel showing recent log messages from AppState
+
+    The panel is reused as long as no message was logged since the last call.
+    """
+    global _log_panel_cache
+    cache_key = (id(state.log_messages[-1]), len(state.log_messages)) if state.log_messages else None
+    if _log_panel_cache[1] is not None and _log_panel_cache[0] == cache_key:
+        return _log_panel_cache[1]
+
     log_table = Table(
         show_header=True,
         header_style="bold blue",
@@ -187,29 +331,25 @@ def create_log_panel(state: AppState) -> Panel:
     log_table.add_column("Level", width=8, no_wrap=True)
     log_table.add_column("Message", no_wrap=False)
 
-    recent_logs = list(state.log_messages)[-8:]
+    # Only the tail is copied, not the whole deque
+    log_count = len(state.log_messages)
+    recent_logs = list(islice(state.log_messages, max(0, log_count - LOG_PANEL_ROWS), log_count))
 
     if recent_logs:
         for log_entry in recent_logs:
             level = log_entry["level"]
-            if level == "ERROR":
-                level_style = "bold red"
-            elif level == "WARNING":
-                level_style = "bold yellow"
-            elif level == "INFO":
-                level_style = "bold green"
-            elif level == "DEBUG":
-                level_style = "dim cyan"
-            else:
-                level_style = "white"
+            level_text = LEVEL_TEXTS.get(level)
+            if level_text is None:
+                level_text = LEVEL_TEXTS[level] = Text(level, style="white")
 
-            time_str = log_entry["time"].strftime("%H:%M:%S")
             message = log_entry["message"]
             if len(message) > 120:
                 message = message[:117] + "..."
 
-            log_table.add_row(time_str, Text(level, style=level_style), message)
+            log_table.add_row(log_entry["time_str"], level_text, message)
     else:
         log_table.add_row("--:--:--", "INFO", "No log messages yet", style="dim italic")
 
-    return Panel(log_table, title="📋 Recent Logs", border_style="blue", padding=(0, 1))
+    panel = Panel(log_table, title="📋 Recent Logs", border_style="blue", padding=(0, 1))
+    _log_panel_cache = (cache_key, panel)
+    return panel
@@ -0,0 +1,113 @@
+"""Guard tests for environment overrides in config(). Run: python -m test.test_config"""
+# Makes every annotation below a string, as in dataclasses declared by users
+# with postponed evaluation
+from __future__ import annotations
+
+import sys, os
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Optional
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.Config import config
+from src.models import ServiceConfig
+
+
+@dataclass
+class Settings:
+    interval: int = 10
+    ratio: float = 0.5
+    enabled: bool = False
+    name: str = "default"
+    limit: Optional[int] = None
+    endpoints: list[str] = field(default_factory=list)
+    tags: dict[str, str] = field(default_factory=dict)
+
+
+@contextmanager
+def env(**values: str):
+    """Set environment variables for the duration of the block"""
+    previous = {key: os.environ.get(key) for key in values}
+    os.environ.update(values)
+    try:
+        yield
+    finally:
+        for key, value in previous.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def test_annotations_are_strings():
+    assert Settings.__dataclass_fields__["interval"].type == "int"
+
+
+def test_defaults_without_env():
+    assert config(Settings) == Settings()
+
+
+def test_int_and_float_overrides():
+    with env(INTERVAL="30", RATIO="0.25", LIMIT="7"):
+        settings = config(Settings)
+    assert settings.interval == 30 and type(settings.interval) is int
+    assert settings.ratio == 0.25
+    assert settings.limit == 7
+
+
+def test_bool_overrides():
+    for value, expected in [("true", True), ("1", True), ("YES", True), ("on", True),
+                            ("false", False), ("0", False), ("no", False)]:
+        with env(ENABLED=value):
+            assert config(Settings).enabled is expected, value
+
+
+def test_json_overrides():
+    with env(ENDPOINTS='["opc.tcp://a:4840", "opc.tcp://b:4840"]', TAGS='{"site": "north"}'):
+        settings = config(Settings)
+    assert settings.endpoints == ["opc.tcp://a:4840", "opc.tcp://b:4840"]
+    assert settings.tags == {"site": "north"}
+
+
+def test_invalid_json_raises():
+    with env(ENDPOINTS="not json"):
+        try:
+            config(Settings)
+        except ValueError:
+            return
+    raise AssertionError("invalid JSON was accepted")
+
+
+def test_unresolvable_annotation_keeps_other_fields():
+    class Local:
+        pass
+
+    # "Local" can't be resolved from this module's globals
+    @dataclass
+    class WithLocal:
+        interval: int = 10
+        enabled: bool = False
+        marker: Optional[Local] = None
+
+    assert config(WithLocal) == WithLocal()
+    with env(INTERVAL="30", ENABLED="yes", MARKER="raw"):
+        settings = config(WithLocal)
+    assert settings.interval == 30 and settings.enabled is True
+    assert settings.marker == "raw"
+
+
+def test_service_config_overrides():
+    with env(POLLING_INTERVAL="15", WATCH_MODEL_CHANGES="true", NAMING_STRATEGY="path"):
+        service_config = config(ServiceConfig)
+    assert service_config.POLLING_INTERVAL == 15
+    assert service_config.WATCH_MODEL_CHANGES is True
+    assert service_config.NAMING_STRATEGY == "path"
+    assert service_config.CACHE_DISCOVERY is False
+
+
+if __name__ == "__main__":
+    fns = [v for k, v in sorted(globals().items()) if k.startswith("test_")]
+    for fn in fns:
+        fn()
+        print(f"ok  {fn.__name__}")
+    print(f"\n{len(fns)} passed")
@@ -0,0 +1,173 @@
+"""Guard tests for discovery batching and result caching. Run: python -m test.test_discovery"""
+import sys, os, asyncio
+from types import SimpleNamespace
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from asyncua import ua
+
+import src.discovery as discovery
+
+ENDPOINT = "opc.tcp://127.0.0.1:4840"
+
+
+class FakeClient:
+    closed = False
+
+    def get_objects_node(self):
+        return SimpleNamespace(session=self, nodeid=ua.NodeId(ua.ObjectIds.ObjectsFolder))
+
+    async def disconnect(self):
+        self.closed = True
+
+
+def variable(identifier: int, name: str) -> ua.ReferenceDescription:
+    reference = ua.ReferenceDescription()
+    reference.NodeId = ua.NodeId(identifier, 2)
+    reference.BrowseName = ua.QualifiedName(name, 2)
+    reference.NodeClass = ua.NodeClass.Variable
+    return reference
+
+
+def run_polls(browse_results: list) -> list:
+    """Run one cached discovery per entry of ``browse_results``, with browse_many
+    raising or returning that entry for the Objects folder. Returns the node
+    counts and the number of browses of each poll."""
+    patched = ("browse_many", "get_client", "server_fingerprint")
+    originals = {name: getattr(discovery, name) for name in patched}
+    browses = []
+
+    async def fake_browse_many(session, node_ids):
+        browses[-1] += 1
+        if node_ids == [ua.NodeId(ua.ObjectIds.ObjectsFolder)]:
+            result = browse_results[len(browses) - 1]
+            if isinstance(result, Exception):
+                raise result
+            return [result]
+        return [[] for _ in node_ids]
+
+    async def fake_get_client(endpoint, resolved_endpoint):
+        return FakeClient()
+
+    async def fake_server_fingerprint(client):
+        return ("start", "build")
+
+    discovery.browse_many = fake_browse_many
+    discovery.get_client = fake_get_client
+    discovery.server_fingerprint = fake_server_fingerprint
+    discovery._discovery_cache.clear()
+    try:
+        polls = []
+        for _ in browse_results:
+            browses.append(0)
+            _, nodes = asyncio.run(discovery.discover_nodes(ENDPOINT, use_cache=True))
+            polls.append((len(nodes), browses[-1]))
+        return polls
+    finally:
+        for name, original in originals.items():
+            setattr(discovery, name, original)
+        discovery._discovery_cache.clear()
+
+
+def test_failed_browse_is_not_cached():
+    nodes = [variable(3, "Temp"), variable(4, "Pressure")]
+    polls = run_polls([TimeoutError(), nodes, nodes])
+    # The failed poll reports nothing and leaves no entry, the next one
+    # browses again; only the complete result is reused
+    assert polls[0] == (0, 1)
+    assert polls[1][0] == 2 and polls[1][1] > 0
+    assert polls[2] == (2, 0)
+
+
+def test_empty_browse_is_not_cached():
+    polls = run_polls([[], [variable(3, "Temp")]])
+    assert polls[0] == (0, 1)
+    assert polls[1][0] == 1 and polls[1][1] > 0
+
+
+def test_browse_batch_size_follows_server_limit():
+    class LimitClient:
+        def __init__(self, limit):
+            self.limit = limit
+
+        def get_node(self, node_id):
+            async def read_value():
+                if isinstance(self.limit, Exception):
+                    raise self.limit
+                return self.limit
+            return SimpleNamespace(read_value=read_value)
+
+    sizes = [asyncio.run(discovery.browse_batch_size(LimitClient(limit)))
+             for limit in (100, 0, 10000, ua.UaStatusCodeError(ua.StatusCodes.BadNodeIdUnknown))]
+    assert sizes == [100, discovery.MAX_NODES_PER_REQUEST, discovery.MAX_NODES_PER_REQUEST,
+                     discovery.MAX_NODES_PER_REQUEST]
+
+
+def test_browse_bfs_chunks_by_batch_size():
+    objects = ua.NodeId(ua.ObjectIds.ObjectsFolder)
+    requests = []
+
+    async def fake_browse_many(session, node_ids):
+        requests.append(len(node_ids))
+        if node_ids == [objects]:
+            return [[variable(i, f"V{i}") for i in range(1, 251)]]
+        return [[] for _ in node_ids]
+
+    original = discovery.browse_many
+    discovery.browse_many = fake_browse_many
+    try:
+        nodes = []
+        root = SimpleNamespace(session=None, nodeid=objects)
+        asyncio.run(discovery.browse_bfs(root, nodes, set(), batch_size=100))
+    finally:
+        discovery.browse_many = original
+    assert len(nodes) == 250
+    assert sorted(requests) == [1, 50, 100, 100]
+
+
+def test_stale_pooled_session_is_retried():
+    stale, fresh = FakeClient(), FakeClient()
+
+    async def fake_get_client(endpoint, resolved_endpoint):
+        pooled = discovery._client_pool.get(endpoint)
+        if pooled is not None:
+            return pooled[1]
+        discovery._client_pool[endpoint] = (resolved_endpoint, fresh)
+        return fresh
+
+    async def fake_browse_many(session, node_ids):
+        # The stale session passed check_connection, but its requests fail
+        if session is stale:
+            raise ConnectionError("connection reset")
+        return [[variable(3, "Temp")] if node_id.Identifier == ua.ObjectIds.ObjectsFolder else []
+                for node_id in node_ids]
+
+    originals = discovery.get_client, discovery.browse_many
+    discovery.get_client, discovery.browse_many = fake_get_client, fake_browse_many
+    discovery._client_pool[ENDPOINT] = (ENDPOINT, stale)
+    try:
+        _, nodes = asyncio.run(discovery.discover_nodes(ENDPOINT))
+        assert len(nodes) == 1
+        assert stale.closed and discovery._client_pool[ENDPOINT][1] is fresh
+    finally:
+        discovery.get_client, discovery.browse_many = originals
+        discovery._client_pool.clear()
+
+
+def test_unconfigured_endpoints_are_pruned():
+    kept, removed = FakeClient(), FakeClient()
+    discovery._client_pool["opc.tcp://kept:4840"] = ("opc.tcp://kept:4840", kept)
+    discovery._client_pool["opc.tcp://removed:4840"] = ("opc.tcp://removed:4840", removed)
+    try:
+        asyncio.run(discovery.prune_clients(["opc.tcp://kept:4840"]))
+        assert list(discovery._client_pool) == ["opc.tcp://kept:4840"]
+        assert removed.closed and not kept.closed
+    finally:
+        discovery._client_pool.clear()
+
+
+if __name__ == "__main__":
+    fns = [v for k, v in sorted(globals().items()) if k.startswith("test_")]
+    for fn in fns:
+        fn()
+        print(f"ok  {fn.__name__}")
+    print(f"\n{len(fns)} passed")
@@ -0,0 +1,113 @@
+"""Guard tests for the poll/write cycle. Run: python -m test.test_main"""
+import sys, os, stat, asyncio, tempfile
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main
+import src.discovery as discovery
+from main import fetch_and_update, wait_for_next_poll, write_config_atomic
+from src.models import AppState, DiscoveredNode, ServiceConfig
+
+TEMPLATE = b'[[inputs.opcua_listener]]\nendpoint = "opc.tcp://s:4840"\n'
+
+
+async def fake_discover_nodes(endpoint, **kwargs):
+    return endpoint, [DiscoveredNode("P_CC", "1", "s", "P_CC")]
+
+
+def poll_after(tamper) -> None:
+    """Poll once, call ``tamper`` with the output path, poll again and check
+    the second poll restored the first output"""
+    original = discovery.discover_nodes
+    discovery.discover_nodes = fake_discover_nodes
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            cfg = ServiceConfig(
+                TELEGRAF_CONFIG_PATH_IN=os.path.join(tmp, "in.conf"),
+                TELEGRAF_CONFIG_PATH_OUT=os.path.join(tmp, "out.conf"),
+            )
+            with open(cfg.TELEGRAF_CONFIG_PATH_IN, "wb") as f:
+                f.write(TEMPLATE)
+            state = AppState()
+
+            asyncio.run(fetch_and_update(cfg, state, use_tui=False))
+            with open(cfg.TELEGRAF_CONFIG_PATH_OUT, "rb") as f:
+                written = f.read()
+            assert b'identifier = "P_CC"' in written
+
+            tamper(cfg.TELEGRAF_CONFIG_PATH_OUT)
+            asyncio.run(fetch_and_update(cfg, state, use_tui=False))
+            with open(cfg.TELEGRAF_CONFIG_PATH_OUT, "rb") as f:
+                assert f.read() == written
+    finally:
+        discovery.discover_nodes = original
+
+
+def test_deleted_output_is_rewritten():
+    poll_after(os.remove)
+
+
+def test_replaced_output_is_rewritten():
+    def replace_with_template(path):
+        with open(path, "wb") as f:
+            f.write(TEMPLATE)
+
+    poll_after(replace_with_template)
+
+
+def test_atomic_write_keeps_mode():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "out.conf")
+        with open(path, "wb") as f:
+            f.write(b"old")
+        os.chmod(path, 0o600)
+
+        asyncio.run(write_config_atomic(path, b"new"))
+        with open(path, "rb") as f:
+            assert f.read() == b"new"
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+
+def wait_through_burst(burst: float, timeout: float) -> float:
+    """Seconds wait_for_next_poll takes with model change events every 0.05s
+    for ``burst`` seconds, at a settle time of 0.2s"""
+    async def run():
+        changed = asyncio.Event()
+
+        async def send_events():
+            end = loop.time() + burst
+            while loop.time() < end:
+                changed.set()
+                await asyncio.sleep(0.05)
+
+        loop = asyncio.get_running_loop()
+        sender = asyncio.create_task(send_events())
+        start = loop.time()
+        await wait_for_next_poll(timeout, changed)
+        sender.cancel()
+        return loop.time() - start
+
+    original = main.MODEL_CHANGE_SETTLE_TIME, main.shutdown_event
+    # An Event is bound to the first loop that waits on it
+    main.MODEL_CHANGE_SETTLE_TIME, main.shutdown_event = 0.2, asyncio.Event()
+    try:
+        return asyncio.run(run())
+    finally:
+        main.MODEL_CHANGE_SETTLE_TIME, main.shutdown_event = original
+
+
+def test_model_change_burst_is_debounced():
+    # Returns once the burst has been quiet for the settle time
+    assert 0.6 <= wait_through_burst(0.5, timeout=10) < 1.5
+
+
+def test_model_change_debounce_is_capped():
+    # An endless burst is cut off one polling interval after the first event
+    assert 0.9 <= wait_through_burst(10, timeout=1) < 1.5
+
+
+if __name__ == "__main__":
+    fns = [v for k, v in sorted(globals().items()) if k.startswith("test_")]
+    for fn in fns:
+        fn()
+        print(f"ok  {fn.__name__}")
+    print(f"\n{len(fns)} passed")
@@ -2,7 +2,8 @@
 import sys, os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.telegraf import node_container, update_telegraf_config
+from src.models import DiscoveredNode
+from src.telegraf import endpoints_from_config, hash_nodes, node_container, update_telegraf_config
 
 
 def test_node_container_prefers_group():
@@ -36,6 +37,60 @@ def test_input_level_injection_without_group():
     assert cfg["inputs"]["opcua_listener"][0]["nodes"] == nodes
 
 
+def test_unchanged_nodes_are_still_injected():
+    nodes = [{"name": "value", "namespace": "1", "identifier_type": "s", "identifier": "P_CC"}]
+    out = {"inputs": {"opcua_listener": [{"endpoint": "opc.tcp://s:4840", "nodes": list(nodes)}]}}
+    cfg = {"inputs": {"opcua_listener": [{"endpoint": "opc.tcp://s:4840", "nodes": []}]}}
+    changed, count = update_telegraf_config(cfg, out, {"opc.tcp://s:4840": nodes}, {})
+    assert not changed and count == 0
+    assert cfg["inputs"]["opcua_listener"][0]["nodes"] == nodes
+
+
+def test_existing_blocks_are_matched_by_endpoint():
+    a = [{"name": "value", "namespace": "1", "identifier_type": "s", "identifier": "A"}]
+    b = [{"name": "value", "namespace": "1", "identifier_type": "s", "identifier": "B"}]
+    out = {"inputs": {"opcua_listener": [
+        {"endpoint": "opc.tcp://10.0.0.2:4840", "nodes": list(b)},
+        {"endpoint": "opc.tcp://a:4840", "nodes": list(a)},
+    ]}}
+    cfg = {"inputs": {"opcua_listener": [
+        {"endpoint": "opc.tcp://a:4840", "nodes": []},
+        {"endpoint": "opc.tcp://b:4840", "nodes": []},
+    ]}}
+    changed, count = update_telegraf_config(
+        cfg, out, {"opc.tcp://a:4840": a, "opc.tcp://b:4840": b},
+        {"opc.tcp://a:4840": "opc.tcp://a:4840", "opc.tcp://b:4840": "opc.tcp://10.0.0.2:4840"}
+    )
+    assert not changed and count == 0
+
+
+def test_hash_nodes_detects_changes():
+    nodes = [{"name": "P_CC", "namespace": "1", "identifier_type": "s", "identifier": "P_CC"}]
+    tagged = [dict(nodes[0], default_tags={"id": "P_CC"})]
+    assert hash_nodes(nodes) == hash_nodes([dict(n) for n in nodes])
+    assert hash_nodes(nodes) != hash_nodes(tagged)
+    assert hash_nodes(nodes) != hash_nodes([])
+
+
+def test_discovered_nodes_are_written_as_tables():
+    node = DiscoveredNode("P_CC", "1", "s", "P_CC", {"id": "P_CC"})
+    assert hash_nodes([node]) == hash_nodes([node.to_dict()])
+    cfg = {"inputs": {"opcua_listener": [{"endpoint": "opc.tcp://s:4840", "nodes": []}]}}
+    update_telegraf_config(cfg, None, {"opc.tcp://s:4840": [node]}, {})
+    assert cfg["inputs"]["opcua_listener"][0]["nodes"] == [
+        {"name": "P_CC", "namespace": "1", "identifier_type": "s", "identifier": "P_CC", "default_tags": {"id": "P_CC"}}
+    ]
+
+
+def test_endpoints_are_deduplicated_in_order():
+    cfg = {"inputs": {"opcua_listener": [
+        {"endpoint": "opc.tcp://b:4840"},
+        {"endpoint": "opc.tcp://a:4840"},
+        {"endpoint": "opc.tcp://b:4840"},
+    ]}}
+    assert endpoints_from_config(cfg) == ["opc.tcp://b:4840", "opc.tcp://a:4840"]
+
+
 if __name__ == "__main__":
     fns = [v for k, v in sorted(globals().items()) if k.startswith("test_")]
     for fn in fns: